@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Browser fallback for the GoDaddy domain checker
+Scrapes GoDaddy's search page with Selenium when the JSON API is blocked
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import re
+import time
+from typing import Optional, Tuple
+from urllib.parse import quote
+try:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.driver_finder import DriverFinder
+    from selenium.common.exceptions import WebDriverException
+except ImportError:  # Selenium is optional; the shared constants still import
+    webdriver = None
+
+# Whether the browser fallback can run at all
+SELENIUM_AVAILABLE = webdriver is not None
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# GoDaddy's search page, with only the domain left to fill in
+_SEARCH_PAGE_TMPL = "https://www.godaddy.com/domainsearch/find?checkAvail=1&domainToCheck={}"
+
+# Page text that says the domain is taken / can be bought
+# (case-insensitive, so the page source never needs lowercasing)
+_TAKEN_RE = re.compile(r"is taken|domain taken|already taken|unavailable|not available", re.IGNORECASE)
+_AVAIL_RE = re.compile(r"add to cart|buy now|add to bag|purchase", re.IGNORECASE)
+
+# Status reported when GoDaddy served a challenge page instead of results
+CAPTCHA_STATUS = "Blocked by captcha"
+# Only looked for in HTML; JSON answers echo the domain name back
+CAPTCHA_RE = re.compile(r"captcha", re.IGNORECASE)
+
+# XHRs that carry GoDaddy's availability answer for the searched domain
+_AVAILABILITY_XHR_RE = re.compile(r"/availab|/searchexact", re.IGNORECASE)
+
+# Resources the scraper never reads; blocking them cuts most page-load bytes
+_BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.css",
+    "*analytics*", "*doubleclick*", "*googletagmanager*"
+]
+
+# Rendered once the search result for the requested domain is on the page
+_RESULT_SELECTOR = "[data-cy='domain-search-result'], .domain-name"
+
+# GoDaddy's search page is a Next.js app that ships its state as JSON
+_NEXT_DATA_SCRIPT = (
+    "var el = document.getElementById('__NEXT_DATA__');"
+    "return el ? JSON.parse(el.textContent) : null;"
+)
+
+# Lazily started so the API path never pays for Chrome; one chromedriver
+# process and one browser session then serve every check in the process
+# (each browser worker process gets its own pair), sharing one set of
+# options so the Chrome binary found for the service is the one launched
+_service = None
+_options = None
+_driver = None
+
+def _chrome_options() -> webdriver.ChromeOptions:
+    """Options for a headless Chrome that looks like a regular browser"""
+    options = webdriver.ChromeOptions()
+    options.add_argument('--headless=new')  # Run in background (new headless mode)
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-blink-features=AutomationControlled')
+    options.add_argument(f'--user-agent={USER_AGENT}')
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+    # Hand control back at DOMContentLoaded and record DevTools network events
+    options.page_load_strategy = 'eager'
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    return options
+
+def _cdp(driver, cmd: str, params: dict) -> dict:
+    """Run a Chrome DevTools Protocol command on a remote Chrome session"""
+    return driver.execute("executeCdpCommand", {"cmd": cmd, "params": params})["value"]
+
+def get_service() -> Service:
+    """Start chromedriver once and keep it running for the life of the process"""
+    global _service, _options
+    if _service is None:
+        service = Service()
+        options = _chrome_options()
+        # Resolve binaries the way webdriver.Chrome does: Selenium Manager
+        # locates (or downloads) Chrome and a matching chromedriver, and
+        # SE_CHROMEDRIVER overrides the driver when set
+        finder = DriverFinder(service, options)
+        if finder.get_browser_path():
+            options.binary_location = finder.get_browser_path()
+            options.browser_version = None
+        service.path = service.env_path() or finder.get_driver_path()
+        service.start()
+        atexit.register(service.stop)
+        _service, _options = service, options
+    return _service
+
+def init_driver():
+    """Open a Chrome session on the shared chromedriver service"""
+    executor = ChromiumRemoteConnection(get_service().service_url, "goog", "chrome")
+    driver = webdriver.Remote(command_executor=executor, options=_options)
+    _cdp(driver, "Network.enable", {})
+    _cdp(driver, "Network.setBlockedURLs", {"urls": _BLOCKED_URLS})
+    return driver
+
+def get_driver():
+    """Return the shared driver, starting Chrome on first use"""
+    global _driver
+    if _driver is None:
+        _driver = init_driver()
+        atexit.register(_driver.quit)
+    return _driver
+
+def init_worker():
+    """Process pool initializer: start this worker's Chrome up front"""
+    try:
+        get_driver()
+    except Exception:
+        pass  # Surfaces as an error on the worker's first check instead
+
+def _close_stray_tabs(driver):
+    """Close any tabs or popups left open so the session stays a single page"""
+    current = driver.current_window_handle
+    for target in _cdp(driver, "Target.getTargets", {})["targetInfos"]:
+        if target["type"] == "page" and target["targetId"] != current:
+            _cdp(driver, "Target.closeTarget", {"targetId": target["targetId"]})
+
+def _availability_from_state(state, full_domain: str) -> Optional[bool]:
+    """Pull the domain's availability out of the page's __NEXT_DATA__ state"""
+    try:
+        entry = state["props"]["pageProps"]["availability"][full_domain]
+    except (KeyError, TypeError):
+        return None
+    if isinstance(entry, dict):
+        entry = entry.get("available")
+    return entry if isinstance(entry, bool) else None
+
+def _performance_log(driver) -> list:
+    """Drain the DevTools events recorded since the last call"""
+    return driver.execute("getLog", {"type": "performance"})["value"]
+
+def _availability_from_json(data, full_domain: str) -> Optional[bool]:
+    """Pull the domain's availability out of an availability XHR body"""
+    if not isinstance(data, dict):
+        return None
+    exact = data.get("ExactMatchDomain")
+    if (isinstance(exact, dict) and str(exact.get("Fqdn", "")).lower() == full_domain
+            and isinstance(exact.get("IsAvailable"), bool)):
+        return exact["IsAvailable"]
+    if str(data.get("domain", "")).lower() == full_domain and isinstance(data.get("available"), bool):
+        return data["available"]
+    return None
+
+def _availability_from_network(driver, full_domain: str, request_ids: set) -> Optional[bool]:
+    """Read the availability XHR's body over CDP once it has finished loading"""
+    for entry in _performance_log(driver):
+        message = json.loads(entry["message"])["message"]
+        params = message.get("params", {})
+        if message["method"] == "Network.responseReceived":
+            if _AVAILABILITY_XHR_RE.search(params["response"]["url"]):
+                request_ids.add(params["requestId"])
+        elif message["method"] == "Network.loadingFinished" and params["requestId"] in request_ids:
+            try:
+                body = _cdp(driver, "Network.getResponseBody", {"requestId": params["requestId"]})
+                is_available = _availability_from_json(json.loads(body["body"]), full_domain)
+            except (WebDriverException, ValueError):
+                continue  # Body evicted or not JSON; keep watching
+            if is_available is not None:
+                return is_available
+    return None
+
+def _wait_for_availability(driver, full_domain: str, timeout: float = 5) -> Optional[bool]:
+    """
+    Poll until the availability XHR, the page's __NEXT_DATA__ state or the
+    rendered result answers, whichever comes first, without waiting for load
+    Returns None if only the rendered result (or the timeout) ended the wait
+    """
+    request_ids = set()
+    deadline = time.monotonic() + timeout
+    while True:
+        is_available = _availability_from_network(driver, full_domain, request_ids)
+        if is_available is not None:
+            return is_available
+
+        try:
+            state = driver.execute_script(_NEXT_DATA_SCRIPT)
+            is_available = _availability_from_state(state, full_domain)
+            if is_available is not None:
+                return is_available
+            # Rendered without usable state: the page scan decides
+            if driver.find_elements(By.CSS_SELECTOR, _RESULT_SELECTOR):
+                return None
+        except WebDriverException:
+            pass  # Page is still navigating; try again on the next poll
+
+        if time.monotonic() >= deadline:
+            return None
+        time.sleep(0.05)
+
+def check_in_browser(full_domain: str) -> Tuple[Optional[bool], str]:
+    """
+    Check a domain by rendering GoDaddy's search page
+    Returns: (is_available, status) where is_available is None if unclear
+    """
+    driver = get_driver()
+    _close_stray_tabs(driver)
+
+    # Navigate without waiting for the load event and take the first answer
+    # the page offers: its availability XHR, embedded state or rendered result
+    _performance_log(driver)  # Discard events from the previous check
+    _cdp(driver, "Page.navigate", {"url": _SEARCH_PAGE_TMPL.format(quote(full_domain, safe=""))})
+    is_available = _wait_for_availability(driver, full_domain)
+    if is_available is not None:
+        return is_available, "Available" if is_available else "Taken"
+
+    # No structured answer: fall back to a single scan of the page source
+    page_text = driver.page_source
+    if CAPTCHA_RE.search(page_text):
+        return None, CAPTCHA_STATUS
+    if _TAKEN_RE.search(page_text):
+        return False, "Taken"
+    # Make sure it's not only showing alternatives
+    if _AVAIL_RE.search(page_text) and re.search(re.escape(full_domain), page_text, re.IGNORECASE):
+        return True, "Available"
+    return None, "Unknown"
@@ -4,197 +4,512 @@ Domain Availability Checker for GoDaddy
 Checks domain availability for .com, .dev, and .ai extensions
 """
 
+import asyncio
 import csv
-import time
+import multiprocessing
+import os
+import sqlite3
 import sys
-from typing import List, Dict
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+import tempfile
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import quote
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Iterator, List, Dict, Optional, Tuple
+import dns.asyncresolver
+import dns.exception
+import dns.resolver
+import httpx
+
+# Selenium is optional, only needed when the API is blocked;
+# browser_checker.SELENIUM_AVAILABLE says whether the fallback can run
+import browser_checker
+from browser_checker import CAPTCHA_RE, USER_AGENT
+
+# Extensions checked by default
+EXTENSIONS = [".com", ".dev", ".ai", ".org"]
+
+# Columns of every result row, in CSV/table order
+FIELDNAMES = ["Domain Name", "Extension", "Full Domain", "Available", "Status"]
+
+# Official API, used when GODADDY_API_KEY / GODADDY_API_SECRET are set
+API_URL = "https://api.godaddy.com/v1/domains/available"
+# Unauthenticated JSON endpoint behind GoDaddy's own search page
+SEARCH_URL = "https://www.godaddy.com/domainfind/v1/json/searchexact"
+
+# Everything about the GoDaddy request that doesn't depend on the domain is
+# resolved once here, so each lookup only formats the domain into the URL
+API_KEY = os.environ.get("GODADDY_API_KEY")
+API_SECRET = os.environ.get("GODADDY_API_SECRET")
+USE_OFFICIAL_API = bool(API_KEY and API_SECRET)
+# The official API also answers up to 500 domains per POST; smaller batches
+# run concurrently and keep the progress bar moving
+BULK_URL = f"{API_URL}?checkType=FAST"
+BULK_SIZE = 50
+_LOOKUP_URL_TMPL = f"{API_URL}?domain={{}}" if USE_OFFICIAL_API else f"{SEARCH_URL}?q={{}}"
+# Sent per request rather than on the client so RDAP servers never see it
+_LOOKUP_HEADERS = {"Authorization": f"sso-key {API_KEY}:{API_SECRET}"} if USE_OFFICIAL_API else {}
+
+# Registry lookups answer most checks before GoDaddy is involved
+RDAP_URL = "https://rdap.org/domain/{}"
+RESOLVER = dns.asyncresolver.Resolver(configure=False)
+RESOLVER.nameservers = ["1.1.1.1", "8.8.8.8"]
+RESOLVER.lifetime = 2
+
+# Maximum number of checks in flight at once
+DEFAULT_CONCURRENCY = 16
+
+# Requests per second sent to GoDaddy before any backoff
+DEFAULT_RATE = 10
+# Times a rate-limited GoDaddy request is retried after backing off
+RATE_LIMIT_RETRIES = 2
+
+# Definitive results are cached in memory and on disk for an hour
+CACHE_PATH = os.path.join(tempfile.gettempdir(), "godaddy_cache.sqlite3")
+CACHE_TTL = 3600
+
+# The memory tier keeps the most recently used results, like an lru_cache
+MEMORY_CACHE_SIZE = 10_000
+
+# full_domain -> (expires_at, is_available, status), least recently used first
+_memory_cache: "OrderedDict[str, Tuple[float, bool, str]]" = OrderedDict()
+# Streamlit runs each session's script on its own thread
+_cache_lock = threading.Lock()
+# Opened once per process: reads happen on the caller's thread, writes are
+# batched onto a dedicated thread so commits never block the event loop
+_cache_reader = None
+_cache_writer = None
+_CACHE_WRITE_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+_pending_writes: List[Tuple[str, int, str, float]] = []
+
+# Browser fallbacks are sharded across processes, each driving its own Chrome
+BROWSER_WORKERS = 4
+_browser_pool = None
+# Concurrent Streamlit sessions may all reach for the pool at once
+_browser_pool_lock = threading.Lock()
+
+def _new_client() -> httpx.AsyncClient:
+    """Create a pooled HTTP client shared by every check in a run"""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=32),
+        timeout=5,
+        headers={"User-Agent": USER_AGENT, "Accept": "application/json"}
+    )
+
+def _get_browser_pool() -> ProcessPoolExecutor:
+    """Start the browser worker processes on first use"""
+    global _browser_pool
+    with _browser_pool_lock:
+        if _browser_pool is None:
+            _browser_pool = ProcessPoolExecutor(
+                max_workers=BROWSER_WORKERS,
+                # Forking would copy the event loop and Streamlit's threads
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=browser_checker.init_worker
+            )
+        return _browser_pool
+
+def _discard_browser_pool(pool: ProcessPoolExecutor):
+    """Drop a broken pool so the next fallback starts fresh workers"""
+    global _browser_pool
+    with _browser_pool_lock:
+        if _browser_pool is pool:
+            _browser_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def _open_disk_cache() -> sqlite3.Connection:
+    """Open a connection to the on-disk cache, creating its table if needed"""
+    db = sqlite3.connect(CACHE_PATH, check_same_thread=False)
+    # WAL lets lookups read while the writer thread commits
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute(
+        "CREATE TABLE IF NOT EXISTS results "
+        "(domain TEXT PRIMARY KEY, available INTEGER, status TEXT, expires_at REAL)"
+    )
+    return db
+
+def _remember(full_domain: str, entry: Tuple[float, bool, str]):
+    """Put an entry in the memory tier, evicting the least recently used"""
+    with _cache_lock:
+        _memory_cache[full_domain] = entry
+        _memory_cache.move_to_end(full_domain)
+        while len(_memory_cache) > MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+def _cache_get(full_domain: str) -> Optional[Tuple[bool, str]]:
+    """Return a cached (is_available, status) that has not expired yet"""
+    global _cache_reader
+    with _cache_lock:
+        entry = _memory_cache.get(full_domain)
+        if entry is not None:
+            _memory_cache.move_to_end(full_domain)
+
+    if entry is None:
+        try:
+            with _cache_lock:
+                if _cache_reader is None:
+                    _cache_reader = _open_disk_cache()
+                row = _cache_reader.execute(
+                    "SELECT expires_at, available, status FROM results WHERE domain = ?",
+                    (full_domain,)
+                ).fetchone()
+        except sqlite3.Error:
+            row = None
+        if row is None:
+            return None
+        entry = (row[0], bool(row[1]), row[2])
+        _remember(full_domain, entry)
+
+    if entry[0] < time.time():
+        with _cache_lock:
+            _memory_cache.pop(full_domain, None)
+        return None
+    return entry[1], entry[2]
 
-def check_domain_availability(driver, domain_name: str, extension: str) -> Dict:
+def _flush_disk_cache():
+    """Write every pending result in one transaction (runs on the writer thread)"""
+    global _cache_writer
+    with _cache_lock:
+        rows = _pending_writes[:]
+        _pending_writes.clear()
+    try:
+        if _cache_writer is None:
+            _cache_writer = _open_disk_cache()
+            # Expired rows are only ever skipped by lookups; prune them once per process
+            with _cache_writer:
+                _cache_writer.execute("DELETE FROM results WHERE expires_at < ?", (time.time(),))
+        with _cache_writer:
+            _cache_writer.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)", rows)
+    except sqlite3.Error:
+        pass  # The disk tier is best effort, e.g. on a read-only filesystem
+
+def _cache_set(full_domain: str, is_available: bool, status: str):
+    """Remember a definitive result in both cache tiers"""
+    expires_at = time.time() + CACHE_TTL
+    _remember(full_domain, (expires_at, is_available, status))
+    with _cache_lock:
+        _pending_writes.append((full_domain, int(is_available), status, expires_at))
+        # The first pending row schedules a flush; later ones ride along with it
+        if len(_pending_writes) == 1:
+            _CACHE_WRITE_EXECUTOR.submit(_flush_disk_cache)
+
+class TokenBucket:
+    """
+    Adaptive rate limiter for requests to GoDaddy
+    Halves the rate when GoDaddy pushes back and regrows it 5% per success
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: Optional[int] = None, min_rate: float = 0.5):
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.rate = rate
+        # Default to one second's worth, so a full bucket can't overshoot the rate
+        self.burst = max(1, int(rate) if burst is None else burst)
+        self.tokens = float(self.burst)
+        self.updated_at = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def consume(self):
+        """Wait until a request may be sent"""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def penalize(self):
+        """Back off after a rate-limit response"""
+        self.rate = max(self.min_rate, self.rate / 2)
+        self.tokens = 0
+
+    def reward(self):
+        """Recover towards the configured rate after a successful request"""
+        self.rate = min(self.max_rate, self.rate * 1.05)
+
+def _is_rate_limited(response: httpx.Response) -> bool:
+    """Whether GoDaddy throttled the request or answered with a challenge page"""
+    if response.status_code == 429:
+        return True
+    content_type = response.headers.get("Content-Type", "")
+    if "html" not in content_type:
+        return False
+    return response.status_code == 403 or bool(CAPTCHA_RE.search(response.text))
+
+async def _probe_registry(client: httpx.AsyncClient, full_domain: str) -> Tuple[Optional[bool], str]:
+    """
+    Answer from DNS and RDAP without asking GoDaddy
+    Returns: (is_available, status) where is_available is None if unclear
+    """
+    try:
+        await RESOLVER.resolve(full_domain, "NS")
+        return False, "Taken (DNS)"
+    except dns.resolver.NoAnswer:
+        # The name exists in the zone, so it is registered
+        return False, "Taken (DNS)"
+    except dns.resolver.NXDOMAIN:
+        pass  # Not delegated, but could still be registered; ask RDAP
+    except dns.exception.DNSException:
+        return None, "Unknown"
+
+    try:
+        response = await client.get(RDAP_URL.format(quote(full_domain, safe="")), follow_redirects=True)
+    except httpx.HTTPError:
+        return None, "Unknown"
+
+    if response.status_code == 200:
+        return False, "Taken (RDAP)"
+    # rdap.org itself answers 404 for TLDs it has no registry for,
+    # so only trust a 404 that came from the registry it redirected to
+    if response.status_code == 404 and response.history:
+        return True, "Available (RDAP)"
+    return None, "Unknown"
+
+async def _send_throttled(bucket: TokenBucket, send: Callable[[], Awaitable[httpx.Response]]) -> Optional[httpx.Response]:
+    """
+    Send a GoDaddy request through the token bucket
+    Backs off and retries when throttled; returns None if it never got through
+    """
+    for _ in range(RATE_LIMIT_RETRIES + 1):
+        await bucket.consume()
+        response = await send()
+        if not _is_rate_limited(response):
+            bucket.reward()
+            return response
+        bucket.penalize()
+    return None
+
+async def _query_bulk(client: httpx.AsyncClient, bucket: TokenBucket, full_domains: List[str]) -> Dict[str, Tuple[bool, str]]:
+    """
+    Ask the official API about many domains with a single POST
+    Returns: full_domain -> (is_available, status) for each domain it answered
+    """
+    response = await _send_throttled(
+        bucket, lambda: client.post(BULK_URL, json=full_domains, headers=_LOOKUP_HEADERS)
+    )
+    # 203 is a partial success: some domains are listed under "errors" instead
+    if response is None or response.status_code not in (200, 203):
+        return {}
+
+    # A malformed body is treated as no answer; check_batch retries each domain
+    data = response.json()
+    entries = data.get("domains") if isinstance(data, dict) else None
+    if not isinstance(entries, list):
+        return {}
+
+    answers = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        domain = entry.get("domain")
+        available = entry.get("available")
+        if isinstance(domain, str) and isinstance(available, bool):
+            answers[domain.lower()] = (available, "Available" if available else "Taken")
+    return answers
+
+async def _query_api(client: httpx.AsyncClient, bucket: TokenBucket, full_domain: str) -> Tuple[Optional[bool], str]:
+    """
+    Ask GoDaddy's JSON API whether a domain is available
+    Returns: (is_available, status) where is_available is None if unclear
+    """
+    # Templates skip httpx's params handling, so escape the domain ourselves
+    url = _LOOKUP_URL_TMPL.format(quote(full_domain, safe=""))
+    response = await _send_throttled(bucket, lambda: client.get(url, headers=_LOOKUP_HEADERS))
+    if response is None:
+        return None, "Rate limited"
+
+    if response.status_code != 200:
+        return None, f"HTTP {response.status_code}"
+
+    # A malformed body is treated as no answer rather than aborting the run
+    data = response.json()
+    if not USE_OFFICIAL_API:
+        data = data.get("ExactMatchDomain") if isinstance(data, dict) else None
+    key = "available" if USE_OFFICIAL_API else "IsAvailable"
+    available = data.get(key) if isinstance(data, dict) else None
+
+    if not isinstance(available, bool):
+        return None, "Unknown"
+    return available, "Available" if available else "Taken"
+
+def _make_result(domain_name: str, extension: str, is_available: Optional[bool], status: str) -> Dict:
+    """Build the result row shared by the CLI, CSV and web UI"""
+    return {
+        "Domain Name": domain_name,
+        "Extension": extension,
+        "Full Domain": f"{domain_name}{extension}",
+        "Available": "Yes" if is_available else "No" if is_available is False else "Unknown",
+        "Status": status
+    }
+
+async def check_one(client: httpx.AsyncClient, semaphore: asyncio.Semaphore, bucket: TokenBucket, domain_name: str, extension: str, force_refresh: bool = False) -> Dict:
     """
     Check if a domain is available on GoDaddy
     Returns: dict with domain info and availability status
     """
     full_domain = f"{domain_name}{extension}"
-    
-    try:
-        # Use GoDaddy's direct search URL (more reliable)
-        search_url = f"https://www.godaddy.com/domainsearch/find?checkAvail=1&domainToCheck={full_domain}"
-        driver.get(search_url)
-        
-        # Wait for page to load
-        time.sleep(3)
-        
-        # Get page content
-        page_text = driver.page_source.lower()
-        page_title = driver.title.lower()
-        
-        # Determine availability based on page content
-        is_available = None
-        status = "Unknown"
-        
-        # Check for "taken" indicators
-        taken_indicators = [
-            "is taken",
-            "domain taken",
-            "already taken",
-            "unavailable",
-            "not available"
-        ]
-        
-        # Check for "available" indicators
-        available_indicators = [
-            "add to cart",
-            "buy now",
-            "add to bag",
-            "purchase"
-        ]
-        
-        # Check if domain is taken
-        for indicator in taken_indicators:
-            if indicator in page_text:
-                is_available = False
-                status = "Taken"
-                break
-        
-        # If not taken, check if available
+
+    cached = None if force_refresh else _cache_get(full_domain)
+    if cached is not None:
+        return _make_result(domain_name, extension, *cached)
+
+    async with semaphore:
+        is_available, status = await _probe_registry(client, full_domain)
+
+        # Only ask GoDaddy when the registry lookups were inconclusive
         if is_available is None:
-            # Look for the specific domain in results
             try:
-                # Try to find the domain result card/row
-                domain_elements = driver.find_elements(
-                    By.XPATH, 
-                    f"//*[contains(text(), '{full_domain}')]"
-                )
-                
-                if domain_elements:
-                    # Check for "Add to Cart" or price buttons near the domain
-                    for element in domain_elements:
-                        try:
-                            parent = element.find_element(By.XPATH, "./ancestor::*[contains(@class, 'domain') or contains(@class, 'result')][1]")
-                            parent_text = parent.text.lower()
-                            
-                            if any(ind in parent_text for ind in available_indicators):
-                                is_available = True
-                                status = "Available"
-                                break
-                            elif any(ind in parent_text for ind in taken_indicators):
-                                is_available = False
-                                status = "Taken"
-                                break
-                        except NoSuchElementException:
-                            # If can't find parent, just use element text
-                            element_text = element.text.lower()
-                            if any(ind in element_text for ind in available_indicators):
-                                is_available = True
-                                status = "Available"
-                                break
-                            elif any(ind in element_text for ind in taken_indicators):
-                                is_available = False
-                                status = "Taken"
-                                break
-                
-                # Fallback: check page text for availability indicators
-                if is_available is None:
-                    if any(ind in page_text for ind in available_indicators):
-                        # Make sure it's not showing alternatives
-                        if f"{full_domain}" in page_text:
-                            is_available = True
-                            status = "Available"
-                    elif "domain taken" in page_text or f"{full_domain} is taken" in page_text:
-                        is_available = False
-                        status = "Taken"
-                        
-            except Exception as e:
-                # Fallback to text-based detection
-                if any(ind in page_text for ind in available_indicators):
-                    is_available = True
-                    status = "Available"
-                elif any(ind in page_text for ind in taken_indicators):
-                    is_available = False
-                    status = "Taken"
-        
-        return {
-            "Domain Name": domain_name,
-            "Extension": extension,
-            "Full Domain": full_domain,
-            "Available": "Yes" if is_available else "No" if is_available is False else "Unknown",
-            "Status": status
-        }
-        
-    except Exception as e:
-        return {
-            "Domain Name": domain_name,
-            "Extension": extension,
-            "Full Domain": full_domain,
-            "Available": "Unknown",
-            "Status": f"Error: {str(e)}"
-        }
-
-def check_domains(domain_names: List[str], extensions: List[str] = [".com", ".dev", ".ai", ".org"]) -> List[Dict]:
+                is_available, status = await _query_api(client, bucket, full_domain)
+            except (httpx.HTTPError, ValueError) as e:
+                is_available, status = None, f"Error: {str(e)}"
+
+    # API blocked or inconclusive: fall back to rendering the search page
+    if is_available is None and browser_checker.SELENIUM_AVAILABLE:
+        loop = asyncio.get_running_loop()
+        # The browser loads godaddy.com too, so it shares the request budget
+        await bucket.consume()
+        pool = _get_browser_pool()
+        try:
+            is_available, status = await loop.run_in_executor(
+                pool, browser_checker.check_in_browser, full_domain
+            )
+        except BrokenProcessPool as e:
+            # A worker died; this check fails but later ones get a new pool
+            _discard_browser_pool(pool)
+            status = f"Error: {str(e)}"
+        except Exception as e:
+            status = f"Error: {str(e)}"
+        else:
+            if status == browser_checker.CAPTCHA_STATUS:
+                bucket.penalize()
+            elif is_available is not None:
+                bucket.reward()
+
+    if is_available is not None:
+        _cache_set(full_domain, is_available, status)
+    return _make_result(domain_name, extension, is_available, status)
+
+async def check_batch(client: httpx.AsyncClient, semaphore: asyncio.Semaphore, bucket: TokenBucket, pairs: List[Tuple[str, str]], force_refresh: bool = False) -> List[Dict]:
+    """
+    Check a batch of (domain_name, extension) pairs with one bulk API request
+    Domains the bulk answer leaves unclear go through check_one individually
+    """
+    results = {}
+    pending = []
+    for domain_name, extension in pairs:
+        cached = None if force_refresh else _cache_get(f"{domain_name}{extension}")
+        if cached is not None:
+            results[(domain_name, extension)] = _make_result(domain_name, extension, *cached)
+        else:
+            pending.append((domain_name, extension))
+
+    answers = {}
+    if pending:
+        # A bulk request counts as one in-flight check against the concurrency limit
+        try:
+            async with semaphore:
+                answers = await _query_bulk(client, bucket, [f"{name}{ext}" for name, ext in pending])
+        except (httpx.HTTPError, ValueError):
+            pass  # Every domain in the batch is retried individually below
+
+    unresolved = []
+    for domain_name, extension in pending:
+        full_domain = f"{domain_name}{extension}"
+        if full_domain in answers:
+            _cache_set(full_domain, *answers[full_domain])
+            results[(domain_name, extension)] = _make_result(domain_name, extension, *answers[full_domain])
+        else:
+            unresolved.append((domain_name, extension))
+
+    retried = await asyncio.gather(*[
+        check_one(client, semaphore, bucket, domain_name, extension, force_refresh)
+        for domain_name, extension in unresolved
+    ])
+    for pair, result in zip(unresolved, retried):
+        results[pair] = result
+
+    return [results[pair] for pair in pairs]
+
+async def _check_single(client: httpx.AsyncClient, semaphore: asyncio.Semaphore, bucket: TokenBucket, pair: Tuple[str, str], force_refresh: bool = False) -> List[Dict]:
+    """check_one shaped like check_batch, so both can share one result stream"""
+    return [await check_one(client, semaphore, bucket, *pair, force_refresh)]
+
+async def iter_domains_async(
+    domain_names: List[str],
+    extensions: List[str],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    force_refresh: bool = False,
+    rate: float = DEFAULT_RATE
+) -> AsyncIterator[Dict]:
+    """
+    Check every domain/extension pair concurrently
+    Yields each result as soon as its check finishes
+    Cached results are reused unless force_refresh is set
+    """
+    names = [name.strip().lower() for name in domain_names if name.strip()]
+    semaphore = asyncio.Semaphore(concurrency)
+    bucket = TokenBucket(rate)
+
+    pairs = [(name, extension) for name in names for extension in extensions]
+
+    async with _new_client() as client:
+        if USE_OFFICIAL_API:
+            jobs = [
+                check_batch(client, semaphore, bucket, pairs[i:i + BULK_SIZE], force_refresh)
+                for i in range(0, len(pairs), BULK_SIZE)
+            ]
+        else:
+            jobs = [_check_single(client, semaphore, bucket, pair, force_refresh) for pair in pairs]
+        tasks = [asyncio.ensure_future(job) for job in jobs]
+        try:
+            for future in asyncio.as_completed(tasks):
+                for result in await future:
+                    yield result
+        finally:
+            # The consumer may stop early; don't leave checks running
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+def check_domains(domain_names: List[str], extensions: List[str] = EXTENSIONS, concurrency: int = DEFAULT_CONCURRENCY) -> Iterator[Dict]:
     """
     Check multiple domains across multiple extensions
-    Returns a list of dictionaries with results
-    """
-    # Setup Selenium WebDriver
-    options = webdriver.ChromeOptions()
-    options.add_argument('--headless=new')  # Run in background (new headless mode)
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--disable-blink-features=AutomationControlled')
-    options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option('useAutomationExtension', False)
-    
-    driver = None
-    results = []
-    
+    Yields a dictionary per result as soon as it is ready
+    """
+    loop = asyncio.new_event_loop()
+    results = iter_domains_async(domain_names, extensions, concurrency)
     try:
-        # Selenium 4.6+ automatically manages ChromeDriver
-        driver = webdriver.Chrome(options=options)
-        driver.implicitly_wait(5)
-        
-        for domain_name in domain_names:
-            domain_name = domain_name.strip().lower()
-            if not domain_name:
-                continue
-                
-            for extension in extensions:
-                print(f"Checking {domain_name}{extension}...")
-                result = check_domain_availability(driver, domain_name, extension)
-                results.append(result)
-                print(f"  Result: {result['Available']} - {result['Status']}")
-                
-                # Small delay between checks
-                time.sleep(2)
-        
-    except Exception as e:
-        print(f"Error setting up browser: {e}")
-        print("Make sure you have ChromeDriver installed and in your PATH")
-        print("Or install it with: brew install chromedriver (on macOS)")
+        while True:
+            try:
+                result = loop.run_until_complete(results.__anext__())
+            except StopAsyncIteration:
+                break
+            print(f"{result['Full Domain']}: {result['Available']} - {result['Status']}")
+            yield result
     finally:
-        if driver:
-            driver.quit()
-    
-    return results
+        loop.run_until_complete(results.aclose())
+        loop.close()
 
-def save_to_csv(results: List[Dict], filename: str = "domain_check_results.csv"):
-    """Save results to a CSV file"""
-    if not results:
+def save_to_csv(results: Iterable[Dict], filename: str = "domain_check_results.csv"):
+    """Write results to a CSV file row by row as they arrive"""
+    results = iter(results)
+    # Don't create (or truncate) the file until there is something to write
+    first = next(results, None)
+    if first is None:
         print("No results to save.")
         return
     
-    fieldnames = ["Domain Name", "Extension", "Full Domain", "Available", "Status"]
-    
     with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer = csv.DictWriter(csvfile, fieldnames=FIELDNAMES)
         writer.writeheader()
-        writer.writerows(results)
+        writer.writerow(first)
+        for result in results:
+            writer.writerow(result)
     
     print(f"\nResults saved to {filename}")
 
@@ -231,21 +546,24 @@ def main():
         return
     
     print(f"\nChecking {len(domain_names)} domain name(s) for .com, .dev, .ai, and .org extensions...")
-    print(f"Total checks: {len(domain_names) * len(extensions)}\n")
+    print(f"Total checks: {len(domain_names) * len(EXTENSIONS)}\n")
+    
+    # Count statuses as results stream through to the CSV
+    counts = Counter()
     
-    results = check_domains(domain_names)
-    save_to_csv(results)
+    def tally(results: Iterable[Dict]) -> Iterator[Dict]:
+        for result in results:
+            counts[result["Available"]] += 1
+            yield result
+    
+    save_to_csv(tally(check_domains(domain_names)))
     
     # Print summary
     print("\n" + "=" * 50)
     print("Summary:")
-    available_count = sum(1 for r in results if r["Available"] == "Yes")
-    taken_count = sum(1 for r in results if r["Available"] == "No")
-    unknown_count = sum(1 for r in results if r["Available"] == "Unknown")
-    
-    print(f"Available: {available_count}")
-    print(f"Taken: {taken_count}")
-    print(f"Unknown/Error: {unknown_count}")
+    print(f"Available: {counts['Yes']}")
+    print(f"Taken: {counts['No']}")
+    print(f"Unknown/Error: {counts['Unknown']}")
 
 if __name__ == "__main__":
     main()
@@ -5,13 +5,11 @@ Deploy this on Python hosting platforms like Streamlit Cloud, Heroku, etc.
 """
 
 import streamlit as st
-import pandas as pd
+import polars as pl
 import time
-from typing import List, Dict
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import io
+import asyncio
+from domain_checker import FIELDNAMES, iter_domains_async
 
 # Page configuration
 st.set_page_config(
@@ -21,6 +19,11 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Availability has three fixed values, so store it as small integer codes
+AVAILABILITY = pl.Enum(['Yes', 'No', 'Unknown'])
+RESULT_SCHEMA = {column: pl.String for column in FIELDNAMES}
+RESULT_SCHEMA.update({'Extension': pl.Categorical, 'Available': AVAILABILITY})
+
 # Custom CSS for better styling
 st.markdown("""
     <style>
@@ -48,138 +51,6 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-@st.cache_resource
-def init_driver():
-    """Initialize and cache the Chrome driver"""
-    options = webdriver.ChromeOptions()
-    options.add_argument('--headless=new')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--disable-blink-features=AutomationControlled')
-    options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option('useAutomationExtension', False)
-    
-    try:
-        driver = webdriver.Chrome(options=options)
-        driver.implicitly_wait(5)
-        return driver
-    except Exception as e:
-        st.error(f"Error initializing browser: {e}")
-        st.info("Make sure ChromeDriver is installed. On macOS: `brew install chromedriver`")
-        return None
-
-def check_domain_availability(driver, domain_name: str, extension: str) -> Dict:
-    """Check if a domain is available on GoDaddy"""
-    full_domain = f"{domain_name}{extension}"
-    
-    try:
-        # Use GoDaddy's direct search URL
-        search_url = f"https://www.godaddy.com/domainsearch/find?checkAvail=1&domainToCheck={full_domain}"
-        driver.get(search_url)
-        time.sleep(2)  # Wait for page to load
-        
-        # Get page content
-        page_text = driver.page_source.lower()
-        
-        # Determine availability
-        is_available = None
-        status = "Unknown"
-        
-        # Check for "taken" indicators
-        taken_indicators = [
-            "is taken",
-            "domain taken",
-            "already taken",
-            "unavailable",
-            "not available"
-        ]
-        
-        # Check for "available" indicators
-        available_indicators = [
-            "add to cart",
-            "buy now",
-            "add to bag",
-            "purchase"
-        ]
-        
-        # Check if domain is taken
-        for indicator in taken_indicators:
-            if indicator in page_text:
-                is_available = False
-                status = "Taken"
-                break
-        
-        # If not taken, check if available
-        if is_available is None:
-            # Look for the specific domain in results
-            try:
-                domain_elements = driver.find_elements(
-                    By.XPATH, 
-                    f"//*[contains(text(), '{full_domain}')]"
-                )
-                
-                if domain_elements:
-                    for element in domain_elements:
-                        try:
-                            parent = element.find_element(By.XPATH, "./ancestor::*[contains(@class, 'domain') or contains(@class, 'result')][1]")
-                            parent_text = parent.text.lower()
-                            
-                            if any(ind in parent_text for ind in available_indicators):
-                                is_available = True
-                                status = "Available"
-                                break
-                            elif any(ind in parent_text for ind in taken_indicators):
-                                is_available = False
-                                status = "Taken"
-                                break
-                        except NoSuchElementException:
-                            element_text = element.text.lower()
-                            if any(ind in element_text for ind in available_indicators):
-                                is_available = True
-                                status = "Available"
-                                break
-                            elif any(ind in element_text for ind in taken_indicators):
-                                is_available = False
-                                status = "Taken"
-                                break
-                
-                # Fallback: check page text
-                if is_available is None:
-                    if any(ind in page_text for ind in available_indicators):
-                        if f"{full_domain}" in page_text:
-                            is_available = True
-                            status = "Available"
-                    elif "domain taken" in page_text or f"{full_domain} is taken" in page_text:
-                        is_available = False
-                        status = "Taken"
-                        
-            except Exception:
-                # Fallback to text-based detection
-                if any(ind in page_text for ind in available_indicators):
-                    is_available = True
-                    status = "Available"
-                elif any(ind in page_text for ind in taken_indicators):
-                    is_available = False
-                    status = "Taken"
-        
-        return {
-            "Domain Name": domain_name,
-            "Extension": extension,
-            "Full Domain": full_domain,
-            "Available": "Yes" if is_available else "No" if is_available is False else "Unknown",
-            "Status": status
-        }
-        
-    except Exception as e:
-        return {
-            "Domain Name": domain_name,
-            "Extension": extension,
-            "Full Domain": full_domain,
-            "Available": "Unknown",
-            "Status": f"Error: {str(e)[:50]}"
-        }
-
 def main():
     # Header
     st.markdown('<h1 class="main-header">🌐 Domain Availability Checker</h1>', unsafe_allow_html=True)
@@ -194,12 +65,18 @@ def main():
             default=[".com", ".dev", ".ai", ".org"]
         )
         
-        delay = st.slider(
-            "Delay between checks (seconds)",
+        max_rate = st.slider(
+            "Max requests/sec",
             min_value=1,
-            max_value=5,
-            value=2,
-            help="Increase if you encounter rate limiting"
+            max_value=20,
+            value=10,
+            help="Upper bound on requests sent to GoDaddy; the checker backs off automatically if it gets rate limited"
+        )
+        
+        force_refresh = st.checkbox(
+            "Force refresh",
+            value=False,
+            help="Ignore results cached during the last hour and re-check every domain"
         )
         
         st.markdown("---")
@@ -219,6 +96,13 @@ def main():
         ```
         """)
     
+    # Build the results frame and count each status once per rerun
+    df = None
+    counts = {}
+    if 'results' in st.session_state and st.session_state.results:
+        df = pl.from_dicts(st.session_state.results, schema=RESULT_SCHEMA)
+        counts = dict(df['Available'].value_counts().iter_rows())
+    
     # Main content area
     col1, col2 = st.columns([2, 1])
     
@@ -248,16 +132,11 @@ def main():
     
     with col2:
         st.subheader("📊 Quick Stats")
-        if 'results' in st.session_state and st.session_state.results:
-            df = pd.DataFrame(st.session_state.results)
-            available = len(df[df['Available'] == 'Yes'])
-            taken = len(df[df['Available'] == 'No'])
-            unknown = len(df[df['Available'] == 'Unknown'])
-            
-            st.metric("✅ Available", available)
-            st.metric("❌ Taken", taken)
-            st.metric("❓ Unknown", unknown)
-            st.metric("📈 Total Checked", len(df))
+        if df is not None:
+            st.metric("✅ Available", counts.get('Yes', 0))
+            st.metric("❌ Taken", counts.get('No', 0))
+            st.metric("❓ Unknown", counts.get('Unknown', 0))
+            st.metric("📈 Total Checked", df.height)
         else:
             st.info("No results yet. Run a check to see stats.")
     
@@ -271,38 +150,31 @@ def main():
             st.warning("⚠️ Please select at least one extension")
             return
         
-        # Initialize driver
-        driver = init_driver()
-        if driver is None:
-            return
-        
         # Calculate total checks
         total_checks = len(domain_names) * len(extensions)
         st.info(f"🔍 Checking {len(domain_names)} domain(s) × {len(extensions)} extension(s) = {total_checks} total checks")
         
-        # Initialize results
-        results = []
         progress_bar = st.progress(0)
         status_text = st.empty()
+        live_table = st.empty()
         
-        # Check domains
-        check_count = 0
-        for idx, domain_name in enumerate(domain_names):
-            if not domain_name:
-                continue
-            
-            for extension in extensions:
-                check_count += 1
-                status_text.text(f"Checking {domain_name}{extension}... ({check_count}/{total_checks})")
-                
-                result = check_domain_availability(driver, domain_name, extension)
+        # Check domains concurrently, showing each result as it finishes
+        results = []
+        last_refresh = 0.0
+        
+        async def run_checks():
+            nonlocal last_refresh
+            async for result in iter_domains_async(domain_names, extensions, force_refresh=force_refresh, rate=max_rate):
                 results.append(result)
+                status_text.text(f"Checked {result['Full Domain']}... ({len(results)}/{total_checks})")
+                progress_bar.progress(len(results) / total_checks)
                 
-                # Update progress
-                progress_bar.progress(check_count / total_checks)
-                
-                # Small delay between checks
-                time.sleep(delay)
+                # Redraw the partial table at most once a second
+                if time.monotonic() - last_refresh >= 1:
+                    live_table.dataframe(pl.from_dicts(results, schema=RESULT_SCHEMA), use_container_width=True, hide_index=True)
+                    last_refresh = time.monotonic()
+        
+        asyncio.run(run_checks())
         
         # Store results in session state
         st.session_state.results = results
@@ -313,12 +185,10 @@ def main():
         st.rerun()
     
     # Display results
-    if 'results' in st.session_state and st.session_state.results:
+    if df is not None:
         st.markdown("---")
         st.subheader("📊 Results")
         
-        df = pd.DataFrame(st.session_state.results)
-        
         # Filter options
         col1, col2, col3 = st.columns(3)
         with col1:
@@ -329,11 +199,11 @@ def main():
             filter_unknown = st.checkbox("Show Unknown", value=True)
         
         # Apply filters
-        filtered_df = df[
-            (df['Available'] == 'Yes') & filter_available |
-            (df['Available'] == 'No') & filter_taken |
-            (df['Available'] == 'Unknown') & filter_unknown
+        selected = [
+            value for value, show in [('Yes', filter_available), ('No', filter_taken), ('Unknown', filter_unknown)]
+            if show
         ]
+        filtered_df = df.filter(pl.col('Available').is_in(selected))
         
         # Display table with styling
         st.dataframe(
@@ -343,7 +213,7 @@ def main():
         )
         
         # Download button
-        csv = filtered_df.to_csv(index=False)
+        csv = filtered_df.write_csv()
         st.download_button(
             label="📥 Download Results as CSV",
             data=csv,
@@ -359,24 +229,28 @@ def main():
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            available_count = len(df[df['Available'] == 'Yes'])
-            st.metric("✅ Available", available_count, f"{available_count/len(df)*100:.1f}%")
+            available_count = counts.get('Yes', 0)
+            st.metric("✅ Available", available_count, f"{available_count/df.height*100:.1f}%")
         
         with col2:
-            taken_count = len(df[df['Available'] == 'No'])
-            st.metric("❌ Taken", taken_count, f"{taken_count/len(df)*100:.1f}%")
+            taken_count = counts.get('No', 0)
+            st.metric("❌ Taken", taken_count, f"{taken_count/df.height*100:.1f}%")
         
         with col3:
-            unknown_count = len(df[df['Available'] == 'Unknown'])
-            st.metric("❓ Unknown", unknown_count, f"{unknown_count/len(df)*100:.1f}%")
+            unknown_count = counts.get('Unknown', 0)
+            st.metric("❓ Unknown", unknown_count, f"{unknown_count/df.height*100:.1f}%")
         
         with col4:
-            st.metric("📊 Total", len(df))
+            st.metric("📊 Total", df.height)
         
         # Breakdown by extension
         st.markdown("### Breakdown by Extension")
-        extension_stats = df.groupby('Extension')['Available'].value_counts().unstack(fill_value=0)
-        st.bar_chart(extension_stats)
+        extension_stats = (
+            df.pivot(on='Available', index='Extension', values='Full Domain', aggregate_function='len')
+            .fill_null(0)
+        )
+        # st.bar_chart wants the extensions as a pandas index
+        st.bar_chart(extension_stats.to_pandas().set_index('Extension'))
 
 if __name__ == "__main__":
     main()